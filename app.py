@@ -1,10 +1,12 @@
+import numpy as np
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
 import streamlit as st
 from PIL import Image
 from scipy.cluster.hierarchy import linkage, dendrogram
 import matplotlib.pyplot as plt
-import seaborn as sns
 
 # Set page config
 st.set_page_config(
@@ -14,22 +16,64 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Load and preprocess data
-@st.cache_data
+# Serialize figures with orjson rather than the stdlib json encoder
+pio.json.config.default_engine = 'orjson'
+
+# City coordinates for the geographic map
+CITY_COORDS = {
+    'Ciudad de México': (19.4326, -99.1332),
+    'Guadalajara': (20.6597, -103.3496),
+    'Monterrey': (25.6866, -100.3161),
+    'Tijuana': (32.5149, -117.0382),
+    'Puebla': (19.0414, -98.2063),
+    'León': (21.1250, -101.6860),
+    'Mérida': (20.9674, -89.5926),
+    'Querétaro': (20.5888, -100.3899)
+}
+CITY_LAT = {city: lat for city, (lat, lon) in CITY_COORDS.items()}
+CITY_LON = {city: lon for city, (lat, lon) in CITY_COORDS.items()}
+
+# Columns filtered through sidebar multiselects
+FILTER_COLUMNS = ['departamento', 'nivel_educacion', 'zona_geografica', 'modalidad_trabajo']
+
+# Columns read from work.parquet; the rest of the file is never used
+USED_COLUMNS = [
+    'departamento', 'nivel_educacion', 'ciudad', 'zona_geografica', 'genero',
+    'estado_civil', 'modalidad_trabajo', 'edad', 'experiencia_anos', 'salario_anual',
+    'horas_semanales', 'horas_ejercicio_semana', 'horas_ocio_semana', 'horas_sueno_noche',
+    'nivel_estres', 'satisfaccion_laboral', 'productividad_score'
+]
+
+# Metrics shown in the correlation heatmap
+CORR_COLS = (
+    'salario_anual', 'edad', 'experiencia_anos', 'horas_semanales',
+    'horas_sueno_noche', 'horas_ocio_semana', 'nivel_estres',
+    'satisfaccion_laboral', 'productividad_score', 'work_life_balance_score'
+)
+
+# Filter combinations kept per st.cache_data function; the oldest entries are
+# evicted so long sessions don't grow the caches without bound
+CACHE_MAX_ENTRIES = 32
+
+# Load and preprocess data. Cached as a shared resource so reruns reuse the
+# same DataFrame without copying it; its column arrays are locked read-only
+# so nothing downstream can modify it in place.
+@st.cache_resource
 def load_data():
-    df = pd.read_csv('work.csv')
-    
-    # Clean data
-    df['salario_anual'] = pd.to_numeric(df['salario_anual'], errors='coerce')
-    df['edad'] = pd.to_numeric(df['edad'], errors='coerce')
-    df['experiencia_anos'] = pd.to_numeric(df['experiencia_anos'], errors='coerce')
+    # work.parquet is generated from work.csv by convert_data.py with the
+    # categorical and compact numeric dtypes already applied
+    df = pd.read_parquet('work.parquet', columns=USED_COLUMNS, engine='pyarrow')
     
     # Create derived columns
-    df['work_life_balance_score'] = (
-        df['horas_sueno_noche'] * 0.4 + 
-        df['horas_ocio_semana'] * 0.3 +
-        (50 - df['horas_semanales']) * 0.3
-    )
+    # sleep * 0.4 + leisure * 0.3 + (50 - work hours) * 0.3, accumulated in
+    # place into one float32 buffer plus one scratch array
+    score = np.subtract(50, df['horas_semanales'].values, dtype=np.float32)
+    score *= 0.3
+    tmp = np.multiply(df['horas_ocio_semana'].values, 0.3, dtype=np.float32)
+    score += tmp
+    np.multiply(df['horas_sueno_noche'].values, 0.4, out=tmp)
+    score += tmp
+    df['work_life_balance_score'] = score
     
     # Map numeric education levels
     education_order = {
@@ -38,14 +82,163 @@ def load_data():
         'Maestría': 3,
         'Doctorado': 4
     }
-    df['education_level_num'] = df['nivel_educacion'].map(education_order)
+    df['education_level_num'] = df['nivel_educacion'].map(education_order).astype('int8')
     
     # Create a count column for visualizations
     df['count'] = 1
     
-    return df
+    # Lock every column buffer (and the arrays it views) against writes;
+    # filter_data hands out df itself when no filter applies
+    for col in df.columns:
+        s = df[col]
+        arr = s.cat.codes.to_numpy() if isinstance(s.dtype, pd.CategoricalDtype) else s.to_numpy()
+        while isinstance(arr, np.ndarray):
+            arr.flags.writeable = False
+            arr = arr.base
+    
+    # Sidebar options and slider bounds, computed once instead of per rerun
+    opts = {col: df[col].cat.categories.tolist() for col in FILTER_COLUMNS}
+    opts['edad'] = (int(df['edad'].min()), int(df['edad'].max()))
+    opts['salario_anual'] = (int(df['salario_anual'].min()), int(df['salario_anual'].max()))
+    
+    return df, opts
+
+df, opts = load_data()
+
+# Full value sets of the multiselect filter columns
+FILTER_VALUES = {col: frozenset(opts[col]) for col in FILTER_COLUMNS}
 
-df = load_data()
+@st.cache_resource
+def category_codes(col):
+    """Integer codes of a categorical column and the code of each label."""
+    cat = df[col].cat
+    return cat.codes.to_numpy(), {label: code for code, label in enumerate(cat.categories)}
+
+def mask_for(col, selected):
+    """Membership mask for a filter column, or None when every value is selected."""
+    if frozenset(selected) == FILTER_VALUES[col]:
+        return None
+    # Look the row codes up in a per-category table: one gather over int8
+    codes, code_of = category_codes(col)
+    table = np.zeros(len(code_of), dtype=bool)
+    table[[code_of[label] for label in selected]] = True
+    return table[codes]
+
+# Raw arrays behind the range sliders, fetched once
+RANGE_VALUES = {col: df[col].to_numpy() for col in ['edad', 'salario_anual']}
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def filter_index(departments, education_levels, zones, work_modes, age_range, salary_range):
+    """Row positions of df matching the sidebar filters."""
+    # AND every predicate into one mask in place, reusing a single scratch
+    # buffer for the comparisons, and index once at the end. Filters left at
+    # their full range or full selection are skipped entirely.
+    mask = np.ones(len(df), dtype=bool)
+    scratch = np.empty(len(df), dtype=bool)
+    filtered = False
+    for col, (low, high) in [('edad', age_range), ('salario_anual', salary_range)]:
+        if (low, high) == opts[col]:
+            continue
+        np.greater_equal(RANGE_VALUES[col], low, out=scratch)
+        np.logical_and(mask, scratch, out=mask)
+        np.less_equal(RANGE_VALUES[col], high, out=scratch)
+        np.logical_and(mask, scratch, out=mask)
+        filtered = True
+    for col, selected in [
+        ('departamento', departments),
+        ('nivel_educacion', education_levels),
+        ('zona_geografica', zones),
+        ('modalidad_trabajo', work_modes)
+    ]:
+        col_mask = mask_for(col, selected)
+        if col_mask is not None:
+            np.logical_and(mask, col_mask, out=mask)
+            filtered = True
+    if not filtered:
+        return np.arange(len(df))
+    return np.flatnonzero(mask)
+
+def filter_data(*filters):
+    """Rows of df matching the sidebar filters."""
+    idx = filter_index(*filters)
+    # Every row matches: hand back df itself rather than a copy
+    if len(idx) == len(df):
+        return df
+    return df.iloc[idx]
+
+def fast_chart(fig):
+    """Render a Plotly figure without Streamlit's theme pass or the mode bar."""
+    st.plotly_chart(fig, theme=None, width='stretch', config={'displayModeBar': False})
+
+# Rows per group shipped to the browser for row-level charts
+PLOT_ROWS_PER_GROUP = 500
+# The 3D scatter builds one trace per department, so it gets a tighter cap
+SCATTER_3D_ROWS_PER_GROUP = 200
+
+def sample_by(data, col, n=PLOT_ROWS_PER_GROUP):
+    """Random sample of at most n rows from each group of col."""
+    shuffled = data.iloc[np.random.default_rng(0).permutation(len(data))]
+    return shuffled[shuffled.groupby(col, observed=True, sort=False).cumcount().values < n]
+
+# Aggregations cached per filter state; arguments are the filter tuples
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def zone_salary(*filters):
+    # Per-zone salary sums and counts straight from the category codes
+    idx = filter_index(*filters)
+    zone = df['zona_geografica'].cat
+    codes = zone.codes.to_numpy()[idx]
+    totals = np.bincount(codes, weights=RANGE_VALUES['salario_anual'][idx], minlength=len(zone.categories))
+    counts = np.bincount(codes, minlength=len(zone.categories))
+    present = np.flatnonzero(counts)
+    return pd.DataFrame({
+        'zona_geografica': zone.categories[present],
+        'salario_anual': totals[present] / counts[present]
+    })
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def zone_counts(*filters):
+    # Binned here so the pie gets one value per zone rather than every row's label
+    zone = df['zona_geografica'].cat
+    counts = np.bincount(zone.codes.to_numpy()[filter_index(*filters)], minlength=len(zone.categories))
+    present = np.flatnonzero(counts)
+    return pd.DataFrame({'zona_geografica': zone.categories[present], 'count': counts[present]})
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def city_summary(*filters):
+    # Count category codes of the matching rows directly and build the
+    # frame from plain arrays; coordinates are looked up per city, not per row
+    city = df['ciudad'].cat
+    counts = np.bincount(city.codes.to_numpy()[filter_index(*filters)], minlength=len(city.categories))
+    present = np.flatnonzero(counts)
+    cities = city.categories[present]
+    return pd.DataFrame({
+        'ciudad': cities,
+        'count': counts[present],
+        'lat': [CITY_LAT[c] for c in cities],
+        'lon': [CITY_LON[c] for c in cities]
+    })
+
+# Ward linkage is quadratic in rows, so cluster a bounded sample
+LINKAGE_MAX_ROWS = 2000
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def cluster_linkage(*filters):
+    dendro_df = filter_data(*filters)[['salario_anual', 'education_level_num', 'experiencia_anos']].dropna()
+    dendro_df = dendro_df.sample(min(len(dendro_df), LINKAGE_MAX_ROWS), random_state=0)
+    return linkage(dendro_df.to_numpy(), method='ward')
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def corr_matrix(*filters):
+    # Take the matching rows first so only they are converted to float32
+    idx = filter_index(*filters)
+    if len(idx) == 0:
+        return np.full((len(CORR_COLS), len(CORR_COLS)), np.nan, dtype=np.float32)
+    # Standardize the columns in place, then one float32 matrix product
+    values = df[list(CORR_COLS)].iloc[idx].to_numpy(dtype=np.float32)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values -= values.mean(axis=0)
+        values /= values.std(axis=0)
+        return (values.T @ values) / len(values)
 
 # Custom CSS
 st.markdown("""
@@ -62,7 +255,12 @@ st.markdown("""
     .header {
         color: #2c3e50;
     }
+    .kpi-row {
+        display: flex;
+        gap: 12px;
+    }
     .kpi-card {
+        flex: 1;
         background-color: white;
         border-radius: 10px;
         padding: 15px;
@@ -99,102 +297,274 @@ with st.sidebar:
     
     departments = st.multiselect(
         "Department",
-        options=df['departamento'].unique(),
-        default=df['departamento'].unique()
+        options=opts['departamento'],
+        default=opts['departamento']
     )
     
     education_levels = st.multiselect(
         "Education Level",
-        options=df['nivel_educacion'].unique(),
-        default=df['nivel_educacion'].unique()
+        options=opts['nivel_educacion'],
+        default=opts['nivel_educacion']
     )
     
     zones = st.multiselect(
         "Geographic Zone",
-        options=df['zona_geografica'].unique(),
-        default=df['zona_geografica'].unique()
+        options=opts['zona_geografica'],
+        default=opts['zona_geografica']
     )
     
     work_modes = st.multiselect(
         "Work Modality",
-        options=df['modalidad_trabajo'].unique(),
-        default=df['modalidad_trabajo'].unique()
+        options=opts['modalidad_trabajo'],
+        default=opts['modalidad_trabajo']
     )
     
     age_range = st.slider(
         "Age Range",
-        min_value=int(df['edad'].min()),
-        max_value=int(df['edad'].max()),
-        value=(int(df['edad'].min()), int(df['edad'].max()))
+        min_value=opts['edad'][0],
+        max_value=opts['edad'][1],
+        value=opts['edad']
     )
     
     salary_range = st.slider(
         "Salary Range (Annual)",
-        min_value=int(df['salario_anual'].min()),
-        max_value=int(df['salario_anual'].max()),
-        value=(int(df['salario_anual'].min()), int(df['salario_anual'].max()))
+        min_value=opts['salario_anual'][0],
+        max_value=opts['salario_anual'][1],
+        value=opts['salario_anual']
     )
 
-# Apply filters
-filtered_df = df[
-    (df['departamento'].isin(departments)) &
-    (df['nivel_educacion'].isin(education_levels)) &
-    (df['zona_geografica'].isin(zones)) &
-    (df['modalidad_trabajo'].isin(work_modes)) &
-    (df['edad'] >= age_range[0]) &
-    (df['edad'] <= age_range[1]) &
-    (df['salario_anual'] >= salary_range[0]) &
-    (df['salario_anual'] <= salary_range[1])
-]
+# Apply filters. Selections are sorted so the same choice made in a
+# different order maps to the same cache entry.
+filters = (
+    tuple(sorted(departments)),
+    tuple(sorted(education_levels)),
+    tuple(sorted(zones)),
+    tuple(sorted(work_modes)),
+    age_range,
+    salary_range
+)
+# Reruns that don't touch the filters (e.g. switching views) reuse the
+# filtered frame kept in session state
+if st.session_state.get('filter_key') != filters:
+    st.session_state.filtered_df = filter_data(*filters)
+    st.session_state.filter_key = filters
+filtered_df = st.session_state.filtered_df
 
 # Header
 st.title("Employee Analytics Dashboard")
 st.markdown("Interactive visualization of employee demographics, compensation, and work patterns")
 
-# KPI Cards
-col1, col2, col3, col4, col5 = st.columns(5)
-with col1:
-    st.markdown('<div class="kpi-card"><div class="kpi-title">Total Employees</div><div class="kpi-value">{:,}</div></div>'.format(len(filtered_df)), unsafe_allow_html=True)
-with col2:
-    st.markdown('<div class="kpi-card"><div class="kpi-title">Avg Salary</div><div class="kpi-value">${:,.0f}</div></div>'.format(filtered_df['salario_anual'].mean()), unsafe_allow_html=True)
-with col3:
-    st.markdown('<div class="kpi-card"><div class="kpi-title">Avg Work Hours</div><div class="kpi-value">{:.1f}</div></div>'.format(filtered_df['horas_semanales'].mean()), unsafe_allow_html=True)
-with col4:
-    st.markdown('<div class="kpi-card"><div class="kpi-title">Avg Stress Level</div><div class="kpi-value">{:.1f}/10</div></div>'.format(filtered_df['nivel_estres'].mean()), unsafe_allow_html=True)
-with col5:
-    st.markdown('<div class="kpi-card"><div class="kpi-title">Avg Productivity</div><div class="kpi-value">{:.1f}/10</div></div>'.format(filtered_df['productividad_score'].mean()), unsafe_allow_html=True)
+# KPI Cards, rendered as a single flexbox row in one markdown call
+KPI_TEMPLATE = '<div class="kpi-card"><div class="kpi-title">{title}</div><div class="kpi-value">{value}</div></div>'
+# All four averages in a single pass over the filtered rows
+if len(filtered_df):
+    kpi_values = filtered_df[['salario_anual', 'horas_semanales', 'nivel_estres', 'productividad_score']].to_numpy()
+    avg_salary, avg_hours, avg_stress, avg_productivity = kpi_values.mean(axis=0, dtype=np.float64)
+else:
+    avg_salary = avg_hours = avg_stress = avg_productivity = np.nan
+kpis = [
+    ("Total Employees", "{:,}".format(len(filtered_df))),
+    ("Avg Salary", "${:,.0f}".format(avg_salary)),
+    ("Avg Work Hours", "{:.1f}".format(avg_hours)),
+    ("Avg Stress Level", "{:.1f}/10".format(avg_stress)),
+    ("Avg Productivity", "{:.1f}/10".format(avg_productivity))
+]
+kpi_html = '<div class="kpi-row">' + ''.join(
+    KPI_TEMPLATE.format(title=title, value=value) for title, value in kpis
+) + '</div>'
+st.markdown(kpi_html, unsafe_allow_html=True)
+
+# Figure builders, cached per filter state so unchanged filters skip
+# rebuilding and validating the Plotly figures
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def salary_box_figure(*filters):
+    data = filter_data(*filters)
+    # Boxes are drawn from precomputed summary statistics, and a sample of
+    # employees goes into a single WebGL scatter overlay, so raw salaries are
+    # never sent to the browser in full
+    # Codes, box labels and ticks all follow the same category order
+    dept = data['departamento'].cat.remove_unused_categories()
+    box_depts = dept.cat.categories
+    dept_codes = dept.cat.codes.to_numpy()
+    salaries = data['salario_anual'].values
+    points_df = sample_by(
+        data[['departamento', 'salario_anual', 'nivel_educacion', 'experiencia_anos']],
+        'departamento'
+    )
+    point_codes = points_df['departamento'].cat.set_categories(box_depts).cat.codes.to_numpy()
+    palette = np.asarray(px.colors.qualitative.Plotly)
+    jitter = np.random.default_rng(0).uniform(-0.3, 0.3, len(point_codes))
+
+    fig1 = go.Figure()
+    low = np.full(len(box_depts), -np.inf)
+    high = np.full(len(box_depts), np.inf)
+    for i, dept in enumerate(box_depts):
+        # Quartiles, Tukey whiskers (furthest points within 1.5 IQR) and mean;
+        # Hazen interpolation is what Plotly's default quartilemethod uses
+        values = salaries[dept_codes == i]
+        q1, median, q3 = np.percentile(values, [25, 50, 75], method='hazen')
+        reach = 1.5 * (q3 - q1)
+        low[i], high[i] = q1 - reach, q3 + reach
+        inside = values[(values >= low[i]) & (values <= high[i])]
+        fig1.add_trace(go.Box(
+            x=[i],
+            q1=[q1],
+            median=[median],
+            q3=[q3],
+            lowerfence=[inside.min()],
+            upperfence=[inside.max()],
+            mean=[values.mean(dtype=np.float64)],
+            name=dept,
+            boxmean=True,
+            marker_color=palette[i % len(palette)]
+        ))
+    fig1.add_trace(go.Scattergl(
+        x=point_codes + jitter,
+        y=points_df['salario_anual'],
+        mode='markers',
+        marker=dict(size=3, opacity=0.4, color=palette[point_codes % len(palette)]),
+        customdata=points_df[['departamento', 'nivel_educacion', 'experiencia_anos']],
+        hovertemplate=(
+            "%{customdata[0]}<br>Annual Salary: %{y:,.0f}<br>"
+            "Education: %{customdata[1]}<br>Experience: %{customdata[2]} yrs<extra></extra>"
+        )
+    ))
+    # Every salary beyond its department's fences, drawn in full like Plotly's
+    # own outlier points
+    outside = (salaries < low[dept_codes]) | (salaries > high[dept_codes])
+    outlier_codes = dept_codes[outside]
+    fig1.add_trace(go.Scattergl(
+        x=outlier_codes,
+        y=salaries[outside],
+        mode='markers',
+        marker=dict(size=5, color=palette[outlier_codes % len(palette)]),
+        customdata=box_depts[outlier_codes],
+        hovertemplate="%{customdata}<br>Outlier Salary: %{y:,.0f}<extra></extra>"
+    ))
+    fig1.update_layout(
+        title="Salary Distribution by Department",
+        xaxis=dict(tickvals=list(range(len(box_depts))), ticktext=list(box_depts)),
+        xaxis_title="Department",
+        yaxis_title="Annual Salary",
+        showlegend=False
+    )
+    return fig1
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def balance_parallel_figure(*filters):
+    data = filter_data(*filters)
+    balance_cols = [
+        'horas_semanales',
+        'horas_ejercicio_semana',
+        'horas_ocio_semana',
+        'horas_sueno_noche',
+        'nivel_estres',
+        'work_life_balance_score'
+    ]
+    fig3a = px.parallel_coordinates(
+        sample_by(data[balance_cols + ['departamento']], 'departamento'),
+        dimensions=balance_cols,
+        color='work_life_balance_score',
+        color_continuous_scale=px.colors.diverging.RdYlGn,
+        title="Work-Life Balance Metrics"
+    )
+    return fig3a
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def balance_scatter_figure(*filters):
+    data = filter_data(*filters)
+    fig3b = px.scatter(
+        data[['horas_semanales', 'work_life_balance_score', 'departamento', 'ciudad', 'modalidad_trabajo']],
+        x='horas_semanales',
+        y='work_life_balance_score',
+        color='departamento',
+        hover_data=['ciudad', 'modalidad_trabajo'],
+        render_mode='webgl',
+        title="Work Hours vs. Work-Life Balance Score"
+    )
+    return fig3b
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def education_3d_figure(*filters):
+    data = filter_data(*filters)
+    fig4 = px.scatter_3d(
+        sample_by(
+            data[['experiencia_anos', 'education_level_num', 'salario_anual', 'departamento',
+                  'productividad_score', 'nivel_educacion', 'ciudad', 'modalidad_trabajo']],
+            'departamento',
+            n=SCATTER_3D_ROWS_PER_GROUP
+        ),
+        x='experiencia_anos',
+        y='education_level_num',
+        z='salario_anual',
+        color='departamento',
+        size='productividad_score',
+        hover_name='nivel_educacion',
+        hover_data=['ciudad', 'modalidad_trabajo'],
+        labels={
+            'education_level_num': 'Education Level',
+            'experiencia_anos': 'Years of Experience',
+            'salario_anual': 'Annual Salary'
+        },
+        title="Education, Experience & Salary (3D View)"
+    )
+
+    fig4.update_layout(
+        scene=dict(
+            yaxis=dict(
+                ticktext=['Bachillerato', 'Licenciatura', 'Maestría', 'Doctorado'],
+                tickvals=[1, 2, 3, 4]
+            )
+        )
+    )
+    return fig4
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def composition_sunburst_figure(*filters):
+    data = filter_data(*filters)
+    fig5a = px.sunburst(
+        data[['departamento', 'nivel_educacion', 'modalidad_trabajo', 'count']],
+        path=['departamento', 'nivel_educacion', 'modalidad_trabajo'],
+        values='count',
+        title="Department Composition by Education & Work Mode"
+    )
+    return fig5a
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def composition_treemap_figure(*filters):
+    data = filter_data(*filters)
+    fig5b = px.treemap(
+        data[['departamento', 'genero', 'estado_civil', 'count', 'salario_anual']],
+        path=['departamento', 'genero', 'estado_civil'],
+        values='count',
+        color='salario_anual',
+        color_continuous_scale='RdBu',
+        title="Department Composition by Gender & Marital Status"
+    )
+    return fig5b
 
 # Main visualizations
-tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
-    "Salary Analysis", 
-    "Geographic Distribution", 
-    "Work-Life Balance",
-    "Education & Experience",
-    "Department Composition",
-    "Advanced Analytics"
-])
-
-with tab1:
+# Only the selected view is built on each rerun
+active = st.radio(
+    "View",
+    [
+        "Salary Analysis",
+        "Geographic Distribution",
+        "Work-Life Balance",
+        "Education & Experience",
+        "Department Composition",
+        "Advanced Analytics"
+    ],
+    horizontal=True,
+    label_visibility="collapsed"
+)
+
+if active == "Salary Analysis":
     st.subheader("Salary Analysis")
     
     col1, col2 = st.columns([3, 1])
     with col1:
-        fig1 = px.box(
-            filtered_df,
-            x='departamento',
-            y='salario_anual',
-            color='departamento',
-            points="all",
-            hover_data=['nivel_educacion', 'experiencia_anos'],
-            title="Salary Distribution by Department"
-        )
-        fig1.update_traces(boxmean=True)
-        fig1.update_layout(
-            xaxis_title="Department",
-            yaxis_title="Annual Salary",
-            showlegend=False
-        )
-        st.plotly_chart(fig1, use_container_width=True)
+        fast_chart(salary_box_figure(*filters))
     
     with col2:
         st.markdown('<div class="insights-card"><div class="insights-title">💰 Salary Insights</div>', unsafe_allow_html=True)
@@ -216,21 +586,18 @@ with tab1:
         """)
         st.markdown('</div>', unsafe_allow_html=True)
 
-with tab2:
+elif active == "Geographic Distribution":
     st.subheader("Geographic Distribution")
     
     col1, col2 = st.columns(2)
     with col1:
         # Employee distribution map
-        city_counts = filtered_df['ciudad'].value_counts().reset_index()
-        city_counts.columns = ['ciudad', 'count']
+        city_counts = city_summary(*filters)
         
         fig2 = px.scatter_geo(
             city_counts,
-            locationmode='country names',
-            locations=['Mexico'] * len(city_counts),
-            lat=filtered_df.groupby('ciudad')['ciudad'].first().apply(lambda x: 19.4326 if x == 'Ciudad de México' else 20.9674),
-            lon=filtered_df.groupby('ciudad')['ciudad'].first().apply(lambda x: -99.1332 if x == 'Ciudad de México' else -89.5926),
+            lat='lat',
+            lon='lon',
             size='count',
             hover_name='ciudad',
             hover_data={'count': True},
@@ -252,7 +619,7 @@ with tab2:
             )
         )
         
-        st.plotly_chart(fig2, use_container_width=True)
+        fast_chart(fig2)
         
         st.markdown('<div class="insights-card"><div class="insights-title">🌎 Geographic Insights</div>', unsafe_allow_html=True)
         st.write("""
@@ -265,23 +632,24 @@ with tab2:
     with col2:
         # Zone distribution
         fig2a = px.pie(
-            filtered_df,
+            zone_counts(*filters),
             names='zona_geografica',
+            values='count',
             hole=0.3,
             title="Employee Distribution by Zone"
         )
-        st.plotly_chart(fig2a, use_container_width=True)
+        fast_chart(fig2a)
         
         # Salary by zone
         fig2b = px.bar(
-            filtered_df.groupby('zona_geografica')['salario_anual'].mean().reset_index(),
+            zone_salary(*filters),
             x='zona_geografica',
             y='salario_anual',
             color='zona_geografica',
             title="Average Salary by Geographic Zone"
         )
         fig2b.update_layout(showlegend=False)
-        st.plotly_chart(fig2b, use_container_width=True)
+        fast_chart(fig2b)
         
         st.markdown('<div class="insights-card"><div class="insights-title">💵 Compensation Trends</div>', unsafe_allow_html=True)
         st.write("""
@@ -291,26 +659,12 @@ with tab2:
         """)
         st.markdown('</div>', unsafe_allow_html=True)
 
-with tab3:
+elif active == "Work-Life Balance":
     st.subheader("Work-Life Balance Analysis")
     
     col1, col2 = st.columns(2)
     with col1:
-        fig3a = px.parallel_coordinates(
-            filtered_df,
-            dimensions=[
-                'horas_semanales',
-                'horas_ejercicio_semana',
-                'horas_ocio_semana',
-                'horas_sueno_noche',
-                'nivel_estres',
-                'work_life_balance_score'
-            ],
-            color='work_life_balance_score',
-            color_continuous_scale=px.colors.diverging.RdYlGn,
-            title="Work-Life Balance Metrics"
-        )
-        st.plotly_chart(fig3a, use_container_width=True)
+        fast_chart(balance_parallel_figure(*filters))
         
         st.markdown('<div class="insights-card"><div class="insights-title">⚖️ Balance Drivers</div>', unsafe_allow_html=True)
         st.write("""
@@ -321,15 +675,7 @@ with tab3:
         st.markdown('</div>', unsafe_allow_html=True)
     
     with col2:
-        fig3b = px.scatter(
-            filtered_df,
-            x='horas_semanales',
-            y='work_life_balance_score',
-            color='departamento',
-            hover_data=['ciudad', 'modalidad_trabajo'],
-            title="Work Hours vs. Work-Life Balance Score"
-        )
-        st.plotly_chart(fig3b, use_container_width=True)
+        fast_chart(balance_scatter_figure(*filters))
         
         st.markdown('<div class="insights-card"><div class="insights-title">📉 Critical Thresholds</div>', unsafe_allow_html=True)
         st.write("""
@@ -346,36 +692,10 @@ with tab3:
     - 30% weight to inverse of work hours (less hours = better score)
     """)
 
-with tab4:
+elif active == "Education & Experience":
     st.subheader("Education & Experience Analysis")
     
-    fig4 = px.scatter_3d(
-        filtered_df,
-        x='experiencia_anos',
-        y='education_level_num',
-        z='salario_anual',
-        color='departamento',
-        size='productividad_score',
-        hover_name='nivel_educacion',
-        hover_data=['ciudad', 'modalidad_trabajo'],
-        labels={
-            'education_level_num': 'Education Level',
-            'experiencia_anos': 'Years of Experience',
-            'salario_anual': 'Annual Salary'
-        },
-        title="Education, Experience & Salary (3D View)"
-    )
-    
-    fig4.update_layout(
-        scene=dict(
-            yaxis=dict(
-                ticktext=['Bachillerato', 'Licenciatura', 'Maestría', 'Doctorado'],
-                tickvals=[1, 2, 3, 4]
-            )
-        )
-    )
-    
-    st.plotly_chart(fig4, use_container_width=True)
+    fast_chart(education_3d_figure(*filters))
     
     col1, col2 = st.columns(2)
     with col1:
@@ -396,18 +716,12 @@ with tab4:
         """)
         st.markdown('</div>', unsafe_allow_html=True)
 
-with tab5:
+elif active == "Department Composition":
     st.subheader("Department Composition Analysis")
     
     col1, col2 = st.columns(2)
     with col1:
-        fig5a = px.sunburst(
-            filtered_df,
-            path=['departamento', 'nivel_educacion', 'modalidad_trabajo'],
-            values='count',
-            title="Department Composition by Education & Work Mode"
-        )
-        st.plotly_chart(fig5a, use_container_width=True)
+        fast_chart(composition_sunburst_figure(*filters))
         
         st.markdown('<div class="insights-card"><div class="insights-title">👥 Workforce Structure</div>', unsafe_allow_html=True)
         st.write("""
@@ -418,15 +732,7 @@ with tab5:
         st.markdown('</div>', unsafe_allow_html=True)
     
     with col2:
-        fig5b = px.treemap(
-            filtered_df,
-            path=['departamento', 'genero', 'estado_civil'],
-            values='count',
-            color='salario_anual',
-            color_continuous_scale='RdBu',
-            title="Department Composition by Gender & Marital Status"
-        )
-        st.plotly_chart(fig5b, use_container_width=True)
+        fast_chart(composition_treemap_figure(*filters))
         
         st.markdown('<div class="insights-card"><div class="insights-title">⚖️ Diversity Insights</div>', unsafe_allow_html=True)
         st.write("""
@@ -437,15 +743,14 @@ with tab5:
         """)
         st.markdown('</div>', unsafe_allow_html=True)
 
-with tab6:
+elif active == "Advanced Analytics":
     st.subheader("Advanced Analytics")
     
     col1, col2 = st.columns(2)
     with col1:
         # Dendrogram
         st.markdown("#### Employee Clustering")
-        dendro_df = filtered_df[['salario_anual', 'education_level_num', 'experiencia_anos']].dropna()
-        Z = linkage(dendro_df, method='ward')
+        Z = cluster_linkage(*filters)
         fig_d, ax = plt.subplots(figsize=(10, 5))
         dendrogram(Z, ax=ax, truncate_mode='lastp', p=15, leaf_rotation=90., leaf_font_size=10.)
         ax.set_title("Hierarchical Clustering Dendrogram")
@@ -462,14 +767,18 @@ with tab6:
     with col2:
         # Correlation heatmap
         st.markdown("#### Metric Correlations")
-        numeric_cols = ['salario_anual', 'edad', 'experiencia_anos', 'horas_semanales', 
-                       'horas_sueno_noche', 'horas_ocio_semana', 'nivel_estres', 
-                       'satisfaccion_laboral', 'productividad_score', 'work_life_balance_score']
-        heat_df = filtered_df[numeric_cols].dropna()
-        corr = heat_df.corr()
-        fig_h, ax = plt.subplots(figsize=(10, 8))
-        sns.heatmap(corr, annot=True, cmap='RdBu_r', center=0, linewidths=0.5, ax=ax)
-        st.pyplot(fig_h)
+        corr = corr_matrix(*filters)
+        fig_h = px.imshow(
+            corr,
+            x=list(CORR_COLS),
+            y=list(CORR_COLS),
+            text_auto='.2f',
+            aspect='auto',
+            color_continuous_scale='RdBu_r',
+            zmin=-1,
+            zmax=1
+        )
+        fast_chart(fig_h)
         
         st.markdown('<div class="insights-card"><div class="insights-title">📊 Correlation Findings</div>', unsafe_allow_html=True)
         st.write("""
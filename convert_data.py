@@ -0,0 +1,39 @@
+"""Convert work.csv into the work.parquet file read by the dashboard.
+
+Run once whenever work.csv changes:
+
+    python convert_data.py
+"""
+import pandas as pd
+
+# Low-cardinality text columns stored as categoricals
+CATEGORY_COLUMNS = [
+    'departamento', 'nivel_educacion', 'ciudad', 'zona_geografica',
+    'genero', 'estado_civil', 'modalidad_trabajo'
+]
+
+# Compact numeric dtypes
+NUMERIC_DTYPES = {
+    'salario_anual': 'float32',
+    'edad': 'int16',
+    'experiencia_anos': 'int16',
+    'horas_semanales': 'float32',
+    'horas_ejercicio_semana': 'int16',
+    'horas_sueno_noche': 'float32',
+    'horas_ocio_semana': 'float32',
+    'nivel_estres': 'float32',
+    'satisfaccion_laboral': 'float32',
+    'productividad_score': 'float32'
+}
+
+
+def convert(src='work.csv', dst='work.parquet'):
+    df = pd.read_csv(src, engine='pyarrow', dtype=NUMERIC_DTYPES)
+    for col in CATEGORY_COLUMNS:
+        df[col] = df[col].astype('category')
+    df.to_parquet(dst, engine='pyarrow', compression='snappy', index=False)
+    return df
+
+
+if __name__ == '__main__':
+    convert()